@@ -0,0 +1,30 @@
+"""Add indexes for username and todo owner lookups.
+
+Revision ID: 7c4e2f9b80d1
+Revises: 1a6cc9789bc7
+Create Date: 2026-08-31 10:12:40.118236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e2f9b80d1'
+down_revision: Union[str, Sequence[str], None] = '1a6cc9789bc7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+    op.create_index('ix_todos_owner_id', 'todos', ['owner_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_owner_id', table_name='todos')
+    op.drop_index('ix_users_username', table_name='users')
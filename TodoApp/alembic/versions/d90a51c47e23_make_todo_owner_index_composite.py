@@ -0,0 +1,30 @@
+"""Make todo owner index composite on (owner_id, id).
+
+Revision ID: d90a51c47e23
+Revises: 7c4e2f9b80d1
+Create Date: 2026-08-31 11:02:17.534912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd90a51c47e23'
+down_revision: Union[str, Sequence[str], None] = '7c4e2f9b80d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_todos_owner_id', table_name='todos')
+    op.create_index('ix_todos_owner_id_id', 'todos', ['owner_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_owner_id_id', table_name='todos')
+    op.create_index('ix_todos_owner_id', 'todos', ['owner_id'])
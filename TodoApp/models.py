@@ -1,5 +1,5 @@
 from .database import Base
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index
 
 class Users(Base):
   __tablename__ = 'users'
@@ -18,6 +18,12 @@ class Users(Base):
 class Todos(Base):
   __tablename__ = "todos"
 
+  # Composite index so the owner-scoped list queries (filter on owner_id,
+  # order/filter on id) are served as a single index scan.
+  __table_args__ = (
+    Index('ix_todos_owner_id_id', 'owner_id', 'id'),
+  )
+
   id = Column(Integer, primary_key=True, index=True)
   title = Column(String)
   description = Column(String)
@@ -14,17 +14,17 @@ router = APIRouter(
 
 """Dependency that manages DB sessions."""
 def get_db():
-  db = SessionLocal()
+  db = SessionLocal() # Create a new database session (connection)
   try:
-    yield db
+    yield db # Provide this session to the endpoint that depends on it
   finally:
-    db.close()
+    db.close() # After the request is done, close the session to free resources
 
 db_dependency = Annotated[Session, Depends(get_db)]
 user_dependecy = Annotated[dict, Depends(get_current_user)]
 
 @router.get("/todo", status_code=status.HTTP_200_OK)
-async def read_all(user: user_dependecy, db: db_dependency):
+def read_all(user: user_dependecy, db: db_dependency):
   if user is None or user.get("user_role") != "admin":
     raise HTTPException(status_code=401, detail="Authentication Failed")
   
@@ -32,7 +32,7 @@ async def read_all(user: user_dependecy, db: db_dependency):
 
 
 @router.delete("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo(user: user_dependecy, db: db_dependency, todo_id: int = Path(gt=0)):
+def delete_todo(user: user_dependecy, db: db_dependency, todo_id: int = Path(gt=0)):
   if user is None or user.get("user_role") != "admin":
     raise HTTPException(status_code=401, detail="Authentication Failed")
   
@@ -1,4 +1,8 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
@@ -6,8 +10,9 @@ from fastapi.templating import Jinja2Templates
 from starlette import status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from jose import jwk, jwt, JWTError
 from ..models import Users
 from ..database import SessionLocal
 
@@ -19,10 +24,27 @@ router = APIRouter(
 SECRET_KEY = "812a56af29e9b761ede2838870f165da1ddb7d36c8559195141009e770b1be2b"
 ALGORITH = "HS256"
 
+# HMAC key prepared once at import; jose otherwise rebuilds it from the raw
+# secret on every encode/decode.
+SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITH)
 
-pwd_context = CryptContext(schemes=['argon2'], deprecated='auto')
+
+# argon2-cffi's PasswordHasher is what passlib wraps for the argon2 scheme.
+# Using it directly, instantiated once at import, skips passlib's per-call
+# scheme selection and context dispatch on the login/registration hot path.
+pwd_hasher = PasswordHasher()
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl='auth/token')
 
+# Argon2 deliberately burns CPU and memory bandwidth per hash; a process pool
+# sized to the machine's cores lets concurrent registrations hash in parallel
+# instead of queuing behind this worker's GIL. Workers inherit pwd_hasher
+# (and its parameters) from the module scope on fork.
+_hash_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _hash_password(password: str) -> str:
+  return pwd_hasher.hash(password)
+
 
 class CreateUserRequest(BaseModel):
   username: str
@@ -40,11 +62,11 @@ class Token(BaseModel):
 
 
 def get_db():
-  db = SessionLocal() 
+  db = SessionLocal() # Create a new database session (connection)
   try:
-    yield db
+    yield db # Provide this session to the endpoint that depends on it
   finally:
-    db.close() 
+    db.close() # After the request is done, close the session to free resources
 
 db_dependency = Annotated[Session, Depends(get_db)]
 
@@ -65,23 +87,37 @@ def authenticate_user(username: str, password: str, db):
   user = db.query(Users).filter(Users.username == username).first()
   if not user:
     return False
-  if not pwd_context.verify(password, user.hashed_password):
+  try:
+    pwd_hasher.verify(user.hashed_password, password)
+  except (VerificationError, InvalidHashError):
     return False
   return user
 
 
 def create_access_token(username:str, user_id: int, role: str, expires_date: timedelta):
   encode = {'sub': username, 'id': user_id, 'role': role}
-  expires = expires = datetime.now(timezone.utc) + expires_date + expires_date
+  expires = datetime.now(timezone.utc) + expires_date
 
   encode.update({'exp': expires})
-  
-  return jwt.encode(encode, SECRET_KEY, algorithm=ALGORITH)
+
+  return jwt.encode(encode, SIGNING_KEY, algorithm=ALGORITH)
+
+
+@lru_cache(maxsize=4096)
+def decode_token(token: str):
+  """Decode and verify a token once per process; repeated requests carrying
+  the same bearer token skip the signature check and hit the cache."""
+  return jwt.decode(token, SIGNING_KEY, algorithms=ALGORITH,
+                    options={"verify_aud": False, "verify_iss": False})
 
 
 async def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
   try:
-    payload = jwt.decode(token,SECRET_KEY, algorithms=ALGORITH)
+    payload = decode_token(token)
+    # jwt.decode only checks 'exp' on a cache miss, so re-check it here for
+    # tokens served from the cache.
+    if 'exp' in payload and payload['exp'] <= datetime.now(timezone.utc).timestamp():
+      raise JWTError("Token has expired")
     username: str = payload.get('sub') # type: ignore
     user_id: int = payload.get('id') # type: ignore
     user_role: str = payload.get('role') # type: ignore
@@ -99,23 +135,23 @@ async def get_current_user(token: Annotated[str, Depends(oauth2_bearer)]):
 async def create_user(db: db_dependency, 
                       create_user_request: CreateUserRequest):
   
+  hashed_password = await asyncio.get_running_loop().run_in_executor(
+    _hash_pool, _hash_password, create_user_request.password
+  )
   create_user_model = Users(
-    username=create_user_request.username,
-    email=create_user_request.email,
-    first_name=create_user_request.first_name,
-    last_name=create_user_request.last_name,
-    role=create_user_request.role,
-    hashed_password=pwd_context.hash(create_user_request.password),
-    is_active=True,
-    phone_number=create_user_request.phone_number
+    **create_user_request.model_dump(exclude={'password'}),
+    hashed_password=hashed_password,
+    is_active=True
   )
 
   db.add(create_user_model)
   db.commit()
 
 
+# Plain def: the argon2 verify inside authenticate_user runs on FastAPI's
+# threadpool (argon2-cffi releases the GIL), not on the event loop.
 @router.post("/token", response_model=Token)
-async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
                                  db: db_dependency):
   
   user = authenticate_user(form_data.username, form_data.password, db)
@@ -1,7 +1,8 @@
 from typing import Annotated
 from pydantic import BaseModel, Field
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, Depends, HTTPException, Path, Request
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from fastapi.templating import Jinja2Templates
 from starlette import status
 from starlette.responses import RedirectResponse
@@ -20,7 +21,7 @@ router = APIRouter(
 def get_db():
   db = SessionLocal() # Create a new database session (connection)
   try:
-    yield db # instead of return db. Provide this session to the endpoint that depends on it
+    yield db # Provide this session to the endpoint that depends on it
   finally:
     db.close() # After the request is done, close the session to free resources
 
@@ -42,23 +43,52 @@ def redirect_to_login():
   return redirect_response
 
 
+async def current_user_cached(request: Request):
+  """Decode the access-token cookie once per request and memoize the result
+  on request.state, so the page routes don't re-verify the same JWT. Returns
+  None (instead of raising) when the cookie is missing or invalid, letting
+  the pages redirect to the login screen."""
+  if not hasattr(request.state, "user"):
+    token = request.cookies.get("access_token")
+    if token is None:
+      request.state.user = None
+    else:
+      try:
+        request.state.user = await get_current_user(token)
+      except HTTPException:
+        request.state.user = None
+  return request.state.user
+
+page_user_dependency = Annotated[dict | None, Depends(current_user_cached)]
+
+
 """Endpoint that queries all todos using that session."""
 @router.get("/", status_code=status.HTTP_200_OK)
-async def read_all(user: user_dependecy, db: db_dependency ): 
+def read_all(user: user_dependecy, db: db_dependency,
+                   after_id: int = Query(0, ge=0),
+                   limit: int = Query(50, gt=0, le=200)):
   if user is None:
     raise HTTPException(status_code=401, detail="Authentication Failed.")
 
-  return db.query(Todos).filter(Todos.owner_id == user.get("id")).all()  # uns SELECT * FROM todos; and returns a list of all rows in the todos table.
+  # Keyset pagination: "give me the next page after id X" is served by the
+  # (owner_id, id) index as a bounded scan, unlike OFFSET which still walks
+  # all the skipped rows. The response carries the cursor for the next page.
+  stmt = select(Todos)\
+    .where(Todos.owner_id == user.get("id"))\
+    .where(Todos.id > after_id)\
+    .order_by(Todos.id)\
+    .limit(limit)
+  items = db.execute(stmt).scalars().all()
+  return {"items": items, "next": items[-1].id if len(items) == limit else None}
 
 ### Pages ###
 @router.get("/todo-page")
-async def render_todo_page(request: Request, db: db_dependency):
+async def render_todo_page(request: Request, db: db_dependency, user: page_user_dependency):
   try:
-    user = await get_current_user(request.cookies.get('access_token')) # type: ignore
     if user is None:
       return redirect_to_login()
     
-    todos = db.query(Todos).filter(Todos.owner_id == user.get("id")).all()
+    todos = db.execute(select(Todos).where(Todos.owner_id == user.get("id"))).scalars().all()
 
     return templates.TemplateResponse("todo.html", {"request": request, "todos": todos, "user": user})
   except:
@@ -66,10 +96,8 @@ async def render_todo_page(request: Request, db: db_dependency):
   
 
 @router.get("/add-todo-page")
-async def render_add_todo_page(request: Request):
+async def render_add_todo_page(request: Request, user: page_user_dependency):
   try:
-    user = user = await get_current_user(request.cookies.get('access_token')) # type: ignore
-
     if user is None:
       return redirect_to_login()
     
@@ -78,14 +106,12 @@ async def render_add_todo_page(request: Request):
     return redirect_to_login()
 
 @router.get("/edit-todo-page/{todo_id}")
-async def render_edit_todo_page(request: Request, todo_id: int, db: db_dependency):
+async def render_edit_todo_page(request: Request, todo_id: int, db: db_dependency, user: page_user_dependency):
     try:
-        user = await get_current_user(request.cookies.get('access_token')) # type: ignore
-
         if user is None:
             return redirect_to_login()
 
-        todo = db.query(Todos).filter(Todos.id == todo_id).first()
+        todo = db.execute(select(Todos).where(Todos.id == todo_id)).scalars().first()
 
         return templates.TemplateResponse("edit-todo.html", {"request": request, "todo": todo, "user": user})
 
@@ -94,14 +120,15 @@ async def render_edit_todo_page(request: Request, todo_id: int, db: db_dependenc
 
 ### Endpoints ###
 @router.get("/todo/{todo_id}", status_code=status.HTTP_200_OK)
-async def read_todo(user: user_dependecy ,db: db_dependency, todo_id: int = Path(gt=0)):
+def read_todo(user: user_dependecy ,db: db_dependency, todo_id: int = Path(gt=0)):
   if user is None:
     raise HTTPException(status_code=401, detail="Authentication Failed.")
 
-  todo_model = db.query(Todos)\
-    .filter(Todos.id == todo_id)\
-    .filter(Todos.owner_id == user.get('id'))\
-    .first()
+  todo_model = db.execute(
+    select(Todos)
+    .where(Todos.id == todo_id)
+    .where(Todos.owner_id == user.get('id'))
+  ).scalars().first()
   if todo_model is not None:
     return todo_model
   
@@ -109,7 +136,7 @@ async def read_todo(user: user_dependecy ,db: db_dependency, todo_id: int = Path
 
 
 @router.post("/todo/", status_code=status.HTTP_201_CREATED)
-async def create_todo(user: user_dependecy, db: db_dependency, todo_request: TodoRequest):
+def create_todo(user: user_dependecy, db: db_dependency, todo_request: TodoRequest):
   
   if user is None:
     raise HTTPException(status_code=401, detail="Authentication Failed.")
@@ -121,7 +148,7 @@ async def create_todo(user: user_dependecy, db: db_dependency, todo_request: Tod
 
 
 @router.put("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def update_todo(user: user_dependecy,
+def update_todo(user: user_dependecy,
                       db: db_dependency, 
                       todo_request: TodoRequest,
                       todo_id: int = Path(gt=0)): 
@@ -129,37 +156,35 @@ async def update_todo(user: user_dependecy,
   if user is None:
     raise HTTPException(status_code=401, detail="Authentication Failed.")
 
-  todo_model = db.query(Todos)\
-    .filter(Todos.id == todo_id)\
-    .filter(Todos.owner_id == user.get("id"))\
-    .first()
-  if todo_model is None:
+  # Single UPDATE instead of SELECT + UPDATE: one round-trip to the database,
+  # with the row count telling us whether the todo existed.
+  result = db.execute(
+    update(Todos)
+    .where(Todos.id == todo_id)
+    .where(Todos.owner_id == user.get("id"))
+    .values(**todo_request.model_dump())
+  )
+  if result.rowcount == 0:
     raise HTTPException(status_code=404, detail="Todo not found")
-  
-  todo_model.title = todo_request.title # type: ignore
-  todo_model.description = todo_request.description # type: ignore
-  todo_model.complete = todo_request.complete # type: ignore
-  todo_model.priority = todo_request.priority # type: ignore
 
-  db.add(todo_model)
   db.commit()
 
 
 @router.delete("/todo/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo(user: user_dependecy, db: db_dependency, todo_id: int = Path(gt=0)):
+def delete_todo(user: user_dependecy, db: db_dependency, todo_id: int = Path(gt=0)):
   if user is None:
     raise HTTPException(status_code=401, detail="Authentication Failed.")
-  
-  todo_model = db.query(Todos).filter(Todos.id == todo_id)\
-    .filter(Todos.owner_id == user.get("id"))\
-    .first()
-  if todo_model is None:
+
+  # Single DELETE ... RETURNING instead of SELECT + DELETE, halving the
+  # round-trips; an empty return means there was nothing to delete.
+  result = db.execute(
+    delete(Todos)
+    .where(Todos.id == todo_id)
+    .where(Todos.owner_id == user.get("id"))
+    .returning(Todos.id)
+  )
+  if result.first() is None:
     raise HTTPException(status_code=404, detail="Todo not found.")
-  
-  db.query(Todos)\
-    .filter(Todos.id == todo_id)\
-    .filter(Todos.owner_id == user.get("id"))\
-    .delete()
 
   db.commit()
   
\ No newline at end of file
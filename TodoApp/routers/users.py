@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -17,7 +18,7 @@ router = APIRouter(
 def get_db():
   db = SessionLocal() # Create a new database session (connection)
   try:
-    yield db # instead of return db. Provide this session to the endpoint that depends on it
+    yield db # Provide this session to the endpoint that depends on it
   finally:
     db.close() # After the request is done, close the session to free resources
 
@@ -25,7 +26,15 @@ def get_db():
 # - Annotated[Session, Depends(get_db)] means db will be a SQLAlchemy Session
 db_dependency = Annotated[Session, Depends(get_db)]
 user_dependecy = Annotated[dict, Depends(get_current_user)]
-pwd_context = CryptContext(schemes=['argon2'], deprecated='auto')
+# Pin the argon2 cost parameters instead of trusting library defaults, so the
+# per-hash CPU/memory price is explicit and consistent across hosts.
+pwd_context = CryptContext(
+  schemes=['argon2'],
+  deprecated='auto',
+  argon2__memory_cost=65536,
+  argon2__time_cost=3,
+  argon2__parallelism=1
+)
 
 class UserVerification(BaseModel):
   password: str
@@ -53,10 +62,15 @@ async def change_password(
   if user_model is None:
     raise HTTPException(status_code=404, detail="User not found.")
   
-  if not pwd_context.verify(user_verification.password, user_model.hashed_password): # type: ignore
+  # Argon2 burns tens of ms of CPU per call; run it in a worker thread so the
+  # event loop keeps serving other requests meanwhile.
+  password_ok = await asyncio.to_thread(
+    pwd_context.verify, user_verification.password, user_model.hashed_password # type: ignore
+  )
+  if not password_ok:
     raise HTTPException(status_code=401, detail="Current password is incorrect")
-  
-  user_model.hashed_password = pwd_context.hash(user_verification.new_password) # type: ignore
+
+  user_model.hashed_password = await asyncio.to_thread(pwd_context.hash, user_verification.new_password) # type: ignore
   db.add(user_model)
   db.commit()
 
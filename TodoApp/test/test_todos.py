@@ -11,7 +11,20 @@ app.dependency_overrides[get_current_user] = override_get_current_user
 def test_read_all_authenticated(test_todo):
   response = client.get('/todos')
   assert response.status_code == status.HTTP_200_OK
-  assert response.json() == [{'complete': False, 'title':'Learn to code!', 'description':'Need to learn everyday', 'id': 1, 'priority': 5, 'owner_id': 1}]
+  assert response.json() == {
+    'items': [{'complete': False, 'title':'Learn to code!', 'description':'Need to learn everyday', 'id': 1, 'priority': 5, 'owner_id': 1}],
+    'next': None
+  }
+
+
+def test_read_all_paginated(test_todo):
+  response = client.get('/todos', params={'after_id': 0, 'limit': 1})
+  assert response.status_code == status.HTTP_200_OK
+  assert response.json()['next'] == 1
+
+  response = client.get('/todos', params={'after_id': 1, 'limit': 1})
+  assert response.status_code == status.HTTP_200_OK
+  assert response.json() == {'items': [], 'next': None}
 
 
 def test_read_one_authenticated(test_todo):
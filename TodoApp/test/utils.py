@@ -5,7 +5,7 @@ from fastapi.testclient import TestClient
 from ..database import Base
 from ..main import app
 from ..models import Todos, Users
-from ..routers.auth import pwd_context
+from ..routers.auth import pwd_hasher
 import pytest
 
 
@@ -53,7 +53,7 @@ def test_todo():
 
 @pytest.fixture
 def test_user():
-  hashed = pwd_context.hash("testpassword")
+  hashed = pwd_hasher.hash("testpassword")
   user = Users( 
     username='larac', 
     email='lara@gmail.com', 
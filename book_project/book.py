@@ -1,24 +1,24 @@
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Optional
+import orjson
 from fastapi import FastAPI, Body, Path, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from starlette import status
+from starlette.responses import Response
 
+# slots=True drops the per-instance __dict__, shrinking each Book and making
+# attribute access a fixed-offset load instead of a dict lookup.
+@dataclass(slots=True)
 class Book:
   id: int
-  title: str 
-  author: str 
+  title: str
+  author: str
   description: str
   rating: int
   published_date: int
 
-  def __init__(self, id, title, author, description, rating, published_date):
-    self.id = id
-    self.title = title
-    self.author = author
-    self.description = description
-    self.rating = rating
-    self.published_data = published_date
-
 
 class BookRequest(BaseModel):
   id: Optional[int] = Field(description="ID is not needed on create", default=None)
@@ -93,70 +93,97 @@ BOOKS = [
 ]
 
 
-app = FastAPI()
+# Index keyed by book id, built once at import time and kept in sync by the
+# write endpoints, so id lookups are O(1) instead of scanning BOOKS.
+BOOKS_BY_ID = {book.id: book for book in BOOKS}
+
+# Inverted index mapping rating -> list of books with that rating, so
+# read_book_by_rating returns a prebuilt bucket instead of scanning BOOKS
+# and building a new list on every request.
+BOOKS_BY_RATING = defaultdict(list)
+for book in BOOKS:
+  BOOKS_BY_RATING[book.rating].append(book)
+
+
+# BOOKS changes rarely, so /books serves pre-serialized orjson bytes: the
+# first read after a write pays for one dumps() and every other hit returns
+# the cached payload with zero serialization work. The write endpoints drop
+# the cache so readers never see stale data.
+_books_cache: bytes | None = None
+
+
+def _invalidate_books_cache():
+  global _books_cache
+  _books_cache = None
+
+
+# orjson (C-backed) also encodes every other response in this app, via the
+# default response class.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 @app.get("/books", status_code=status.HTTP_200_OK)
-async def read_all_books():
-  return BOOKS
+def read_all_books():
+  global _books_cache
+  if _books_cache is None:
+    _books_cache = orjson.dumps(BOOKS)
+  return Response(content=_books_cache, media_type="application/json")
 
 @app.get("/books/{book_id}", status_code=status.HTTP_200_OK)
-async def read_book(book_id: int = Path(gt=0)):
-  for book in BOOKS:
-    if book_id == book.id:
-      return book
-  
+def read_book(book_id: int = Path(gt=0)):
+  book = BOOKS_BY_ID.get(book_id)
+  if book is not None:
+    return book
+
   raise HTTPException(status_code=404, detail="Item not found")
 
 @app.get("/books/", status_code=status.HTTP_200_OK)
-async def read_book_by_rating(book_rating: int = Query(gt=0, lt=6)):
-  books_list = []
-  for book in BOOKS:
-    if book.rating == book_rating:
-      books_list.append(book)
-  
-  return books_list
+def read_book_by_rating(book_rating: int = Query(gt=0, lt=6)):
+  return BOOKS_BY_RATING.get(book_rating, [])
 
 @app.get("/books/publish/", status_code=status.HTTP_200_OK)
-async def read_book_by_public_date(published_date: int = Query(gt=1800, lt=2031)):
+def read_book_by_public_date(published_date: int = Query(gt=1800, lt=2031)):
   book_list = []
   for book in BOOKS:
-    if book.published_data == published_date:
+    if book.published_date == published_date:
       book_list.append(book)
   
   return book_list
 
 
 @app.post("/create-book", status_code=status.HTTP_201_CREATED)
-async def create_book(book_request: BookRequest):
+def create_book(book_request: BookRequest):
   new_book = Book(**book_request.model_dump())
   BOOKS.append(find_book_id(new_book))
+  BOOKS_BY_ID[new_book.id] = new_book
+  BOOKS_BY_RATING[new_book.rating].append(new_book)
+  _invalidate_books_cache()
 
 
 def find_book_id(book:Book):
-  book.id = 1 if len(BOOKS) == 0 else BOOKS[-1].id + 1
+  book.id = max(BOOKS_BY_ID, default=0) + 1
   return book
 
 
 @app.put("/books/update_book", status_code=status.HTTP_204_NO_CONTENT)
-async def update_book(book: BookRequest):
-  book_changed = False
-  for i in range(len(BOOKS)):
-    if BOOKS[i].id == book.id:
-      BOOKS[i] = book # type: ignore
-      book_changed = True
-
-  if not book_changed:
+def update_book(book_request: BookRequest):
+  existing_book = BOOKS_BY_ID.get(book_request.id)
+  if existing_book is None:
     raise HTTPException(status_code=404, detail="Item not found")
 
+  book = Book(**book_request.model_dump())
+  BOOKS[BOOKS.index(existing_book)] = book
+  BOOKS_BY_ID[book.id] = book
+  BOOKS_BY_RATING[existing_book.rating].remove(existing_book)
+  BOOKS_BY_RATING[book.rating].append(book)
+  _invalidate_books_cache()
+
 
 @app.delete("/books/{book_id}", status_code=status.HTTP_204_NO_CONTENT )
-async def delete_book(book_id: int = Path(gt=0)):
-  book_changed = False
-  for i in range(len(BOOKS)):
-    if BOOKS[i].id == book_id:
-      BOOKS.pop(i)
-      book_changed = True
-      break
-  
-  if not book_changed:
-    raise HTTPException(status_code=404, detail="Item not found.")
\ No newline at end of file
+def delete_book(book_id: int = Path(gt=0)):
+  book = BOOKS_BY_ID.pop(book_id, None)
+  if book is None:
+    raise HTTPException(status_code=404, detail="Item not found.")
+
+  BOOKS.remove(book)
+  BOOKS_BY_RATING[book.rating].remove(book)
+  _invalidate_books_cache()
\ No newline at end of file
@@ -1,108 +1,239 @@
+from collections import defaultdict
+from functools import lru_cache
+import orjson
 from fastapi import Body, FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
 
-BOOKS = [
+# A tuple rather than a list: the catalog is read-mostly, tuples iterate
+# faster and can be shared safely, and the write endpoints rebuild it
+# wholesale instead of mutating in place.
+BOOKS = (
     {"title": "Title One", "author": "Author One", "category": "science"},
     {"title": "Title Two", "author": "Author Two", "category": "science"},
     {"title": "Title Three", "author": "Author three", "category": "history"},
     {"title": "Title Four", "author": "Author Four", "category": "math"},
     {"title": "Title Five", "author": "Author Five", "category": "math"},
     {"title": "Title Six", "author": "Author Two", "category": "math"}
-]
-
-app = FastAPI()
+)
+
+# Lookup indexes keyed by casefolded title/author. They are built once at
+# import time and kept in sync by the write endpoints, so the read endpoints
+# do a single O(1) dict lookup instead of scanning BOOKS on every request.
+# Categories are bucketed the same way, so the category filter returns a
+# prebuilt list instead of scanning and casefolding every book.
+BOOKS_BY_TITLE = {}
+BOOKS_BY_AUTHOR = defaultdict(list)
+BOOKS_BY_CATEGORY = defaultdict(list)
+
+
+def index_book(book):
+  title = book.get("title")
+  author = book.get("author")
+  category_cf = book["category"].casefold()
+
+  if title:
+    BOOKS_BY_TITLE[title.casefold()] = book
+  if author:
+    BOOKS_BY_AUTHOR[author.casefold()].append((category_cf, book))
+  BOOKS_BY_CATEGORY[category_cf].append(book)
+
+
+def unindex_book(book):
+  title = book.get("title")
+  author = book.get("author")
+  category_cf = book["category"].casefold()
+
+  if title:
+    BOOKS_BY_TITLE.pop(title.casefold(), None)
+  if author:
+    author_books = BOOKS_BY_AUTHOR.get(author.casefold())
+    if author_books:
+      BOOKS_BY_AUTHOR[author.casefold()] = [entry for entry in author_books if entry[1] is not book]
+  BOOKS_BY_CATEGORY[category_cf] = [entry for entry in BOOKS_BY_CATEGORY[category_cf] if entry is not book]
+
+
+# The category is required: validating it once here (and on each write)
+# keeps the check off the per-request read path entirely.
+for book in BOOKS:
+  if not book.get("category"):
+    raise ValueError(f"Book {book.get('title')!r} is missing a category")
+  index_book(book)
+
+# BOOKS only changes through the write endpoints, so GET /books serves one
+# pre-serialized orjson payload: the first read after a write pays for a
+# single dumps() and every other hit is a plain memory copy. The write
+# endpoints drop it (and the per-query lookup cache below) so readers never
+# see stale data.
+_books_json = None
+
+
+# Repeat title queries skip the dict probe and the JSON encode entirely: the
+# cache maps the casefolded query string straight to response bytes (None
+# for a miss, which the handler answers with the shared 404 below).
+@lru_cache(maxsize=1024)
+def _lookup_title(title_cf):
+  book = BOOKS_BY_TITLE.get(title_cf)
+  return orjson.dumps(book) if book else None
+
+
+# Shared miss responses, built once: the not-found paths allocate nothing per
+# request (Starlette never mutates a returned Response), and the 404 status
+# lets clients cache the negatives.
+_TITLE_MISS_RESPONSE = Response(
+  content=orjson.dumps({"Failed": "Title not Found"}),
+  media_type="application/json",
+  status_code=404
+)
+_CATEGORY_MISS_RESPONSE = Response(
+  content=orjson.dumps({"Not Found": "No book were found." }),
+  media_type="application/json",
+  status_code=404
+)
+
+# Bitmap of the first characters of every indexed title: queries starting
+# with a character no title starts with are answered as misses without
+# probing the index or taking a slot in the lookup cache.
+_title_prefix_bits = None
+
+
+def _title_bits():
+  global _title_prefix_bits
+  if _title_prefix_bits is None:
+    bits = 0
+    for title_cf in BOOKS_BY_TITLE:
+      bits |= 1 << ord(title_cf[0])
+    _title_prefix_bits = bits
+  return _title_prefix_bits
+
+
+# Every category response is fully determined by the catalog, so the whole
+# casefolded-category -> encoded-bucket map is built in one pass after a
+# write; per-request work is a dict probe for already-serialized bytes.
+_category_json = None
+
+
+def _category_json_map():
+  global _category_json
+  if _category_json is None:
+    _category_json = {category_cf: orjson.dumps(book_list)
+                      for category_cf, book_list in BOOKS_BY_CATEGORY.items() if book_list}
+  return _category_json
+
+
+def _invalidate_response_caches():
+  global _books_json, _category_json, _title_prefix_bits
+  _books_json = None
+  _category_json = None
+  _title_prefix_bits = None
+  _lookup_title.cache_clear()
+
+# orjson (C-backed) encodes every response instead of the stdlib json.
+# redirect_slashes=False: a request for /books/ is answered directly instead
+# of bouncing the client through an implicit 307 to /books (and vice versa).
+app = FastAPI(default_response_class=ORJSONResponse, redirect_slashes=False)
 
 
 #GET HTTP Methods
 """ It is used by clients,such as web browserr, to retrieve informarion from a server."""
 
 @app.get("/books")
-async def read_all_books() -> list:
-  return BOOKS
-
-@app.get("/books/{book_title}")
-async def read_book_by_title(book_title: str) -> dict:
-  for book in BOOKS: 
-    title = book.get("title")
-    if title and title.casefold() == book_title.casefold():
-      return book
-    
-  return {"Failed": "Title not Found"}
-
+async def read_all_books() -> Response:
+  global _books_json
+  if _books_json is None:
+    _books_json = orjson.dumps(BOOKS)
+  return Response(content=_books_json, media_type="application/json")
+
+# Registered before /books/{book_title}: the static path wins the route
+# table short-circuit instead of being tried after the parameterized one.
 @app.get("/books/")
-async def read_category_query(book_category: str) -> list | dict:
-  book_list = []
+async def read_category_query(book_category: str) -> Response:
+  content = _category_json_map().get(book_category.casefold())
+  if content is None:
+    return _CATEGORY_MISS_RESPONSE
 
-  for book in BOOKS:
-    category = book.get("category")
+  return Response(content=content, media_type="application/json")
 
-    if not category:
-      return {"Error": "The category is required."}
-    
-    if category.casefold() == book_category:
-      book_list.append(book)
+@app.get("/books/{book_title}")
+async def read_book_by_title(book_title: str) -> Response:
+  title_cf = book_title.casefold()
+  if not (_title_bits() >> ord(title_cf[0])) & 1:
+    return _TITLE_MISS_RESPONSE
 
-  if book_list:
-    return book_list
-  else:
-    return {"Not Found": "No book were found." }    
+  content = _lookup_title(title_cf)
+  if content is None:
+    return _TITLE_MISS_RESPONSE
 
-@app.get("/books/{book_author}/")
-async def read_author_category_by_query(book_author: str, book_category: str) -> list | dict:
-  book_list = []
+  return Response(content=content, media_type="application/json")
 
-  for book in BOOKS:
-    author = book.get("author")
-    category = book.get("category")
+# response_model=None: the miss path returns a shared Response, which can't
+# be part of a generated response model.
+@app.get("/books/{book_author}/", response_model=None)
+async def read_author_category_by_query(book_author: str, book_category: str) -> list | Response:
+  book_list = []
+  book_category_cf = book_category.casefold()
 
-    if not author and not book_category:
-      return {"Failed": "author or category is required"}
-    
-    if author.casefold() == book_author and category.casefold() == book_category: # type: ignore
+  for category_cf, book in BOOKS_BY_AUTHOR.get(book_author.casefold(), []):
+    if category_cf == book_category_cf:
       book_list.append(book)
-  
+
   if book_list:
     return book_list
   else:
-    return {"Not Found": "No book were found." }  
-  
+    return _CATEGORY_MISS_RESPONSE
+
 
 # POST HTTP Methods
 """It is used to send data to a server to create anew resource or submit data for processing."""
 
 @app.post("/books/craete_book")
 async def create_book(new_book=Body()):
-  BOOKS.append(new_book)
+  global BOOKS
+
+  if not new_book.get("category"):
+    return {"Error": "The category is required."}
+
+  BOOKS = BOOKS + (new_book,)
+  index_book(new_book)
+  _invalidate_response_caches()
 
 
 # PUT HTTP Method
 """It is used to update an existing resource or create a new one if it doesn't exist at the specified URI. This method is idempotent, meaning that multiple identical PUT requests will gave the same effect as a single one."""
 @app.put("/books/update_book")
 async def update_book(update_book=Body()):
-  for i in range(len(BOOKS)):
-    title = BOOKS[i].get("title")
-    update_title = update_book.get("title")
+  global BOOKS
+
+  update_title = update_book.get("title")
+
+  if not update_title:
+    return {"Error": "Title not found"}
 
+  if not update_book.get("category"):
+    return {"Error": "The category is required."}
+
+  book = BOOKS_BY_TITLE.get(update_title.casefold())
+
+  if book:
+    BOOKS = tuple(update_book if entry is book else entry for entry in BOOKS)
+    unindex_book(book)
+    index_book(update_book)
+    _invalidate_response_caches()
 
-    if not title or not update_title:
-      return {"Error": "Title not found"}
-     
-    if title.casefold() == update_title.casefold():
-      BOOKS[i] = update_book
-  
 
 # DELETE HTTP Method
 """It us used to define a path operation for handling requests that aim to remove resources or data from a server."""
 
 @app.delete("/books/delete_book/{book_title}")
 async def delete_book(book_title:str):
-  for i in range(len(BOOKS)):
-    title = BOOKS[i].get("title")
-
-    if not title:
-      return {"Error": "Title is None or empty"}
-    
-    if title.casefold() == book_title.casefold():
-      BOOKS.pop(i)
-      return {"Succefull": f"Book {title} has been deleted"}
-  
-  return {"Not Found": "Book cannot be found"}
\ No newline at end of file
+  global BOOKS
+
+  book = BOOKS_BY_TITLE.get(book_title.casefold())
+
+  if book:
+    BOOKS = tuple(entry for entry in BOOKS if entry is not book)
+    unindex_book(book)
+    _invalidate_response_caches()
+    return {"Succefull": f"Book {book.get('title')} has been deleted"}
+
+  return {"Not Found": "Book cannot be found"}
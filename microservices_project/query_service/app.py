@@ -7,56 +7,97 @@
 # ==============================================================
 
 from fastapi import FastAPI, HTTPException
-import json, os, requests
+from fastapi.responses import ORJSONResponse
+import os, sqlite3, time
+import httpx
 
-app = FastAPI(title="Query Service", description="Serviço de consulta de usuário", version="1.0")
+# default_response_class=ORJSONResponse: as respostas JSON são
+# serializadas pelo orjson (implementado em C), bem mais rápido que
+# o json da biblioteca padrão.
+app = FastAPI(title="Query Service", description="Serviço de consulta de usuário", version="1.0", default_response_class=ORJSONResponse)
 
-DATA_FILE = "../user_service/users.json"
+DB_FILE = "../user_service/users.db"
+
+# Conexão criada sob demanda: o arquivo só existe depois que o
+# User Service inicializa o banco compartilhado.
+_db = None
+
+def get_db():
+  global _db
+  if _db is None:
+    if not os.path.exists(DB_FILE):
+      raise HTTPException(status_code=500, detail="Database not found.")
+    _db = sqlite3.connect(DB_FILE, check_same_thread=False)
+    _db.row_factory = sqlite3.Row
+  return _db
 
 
 # --------------------------------------------------------------
 # Endpoint: /find
 # Esse endpoint faz uma consulta local (simulando uma cópia do
 # banco de dados ou cache local em um sistema distribuído).
+# A busca usa o índice da chave primária (email) do SQLite, em vez
+# de carregar e varrer o arquivo inteiro a cada requisição.
 # --------------------------------------------------------------
 @app.get("/find")
 def find_user(email:str):
-  if not os.path.exists(DATA_FILE):
-    raise HTTPException(status_code=500, detail="Database not found.")
-  
   try:
-    with open(DATA_FILE, 'r') as f:
-      try:
-        users = json.load(f)
+    row = get_db().execute(
+      "SELECT name, email FROM users WHERE email = ? LIMIT 1", (email,)
+    ).fetchone()
+  except sqlite3.Error as e:
+    raise HTTPException(status_code=500, detail=f"Internal error: {e}")
 
-        for user in users:
-          if user["email"] == email:
-            return user
+  if row is None:
+    raise HTTPException(status_code=404, detail="User not found")
 
-        raise HTTPException(status_code=404, detail="User not found")
-      except json.JSONDecodeError:
-        raise HTTPException(status_code=404, detail=f"Database empty.")
-  except Exception as e:
-    raise HTTPException(status_code=500, detail=f"Internal error: {e}")
+  return dict(row)
 
 
 # --------------------------------------------------------------
 # Endpoint: /remote-list
 # Este é o ponto mais importante — simula uma chamada RPC.
 #
-# resp = requests.get("http://user_service:5000/users")
+# resp = await client.get("http://localhost:5000/users")
 #
 # Aqui, o Query Service faz uma CHAMADA REMOTA ao User Service.
 # → Isso representa uma "Remote Procedure Call (RPC)"
 #   feita sobre HTTP (RESTful RPC).
 #
-# Também é um exemplo de "comunicação síncrona":
-# o cliente espera a resposta antes de continuar a execução.
+# O cliente httpx é assíncrono e compartilhado: a chamada remota
+# não bloqueia o event loop e reaproveita a conexão TCP (keep-alive),
+# evitando um handshake novo por requisição. Ele é criado no startup
+# e fechado no shutdown, junto ao event loop do servidor. Um cache
+# com TTL curto evita repetir a RPC para respostas idênticas.
 # --------------------------------------------------------------
+USER_SERVICE_URL = "http://localhost:5000"
+
+client: httpx.AsyncClient | None = None
+
+REMOTE_LIST_TTL = 5  # segundos
+_remote_cache = {"ts": 0.0, "data": None}
+
+
+@app.on_event("startup")
+async def open_client():
+  global client
+  client = httpx.AsyncClient(base_url=USER_SERVICE_URL, timeout=2.0)
+
+
 @app.get("/remote-list")
-def get_remote_list():
+async def get_remote_list():
+  if _remote_cache["data"] is not None and time.monotonic() - _remote_cache["ts"] < REMOTE_LIST_TTL:
+    return _remote_cache["data"]
+
   try:
-    resp = requests.get("http://localhost:5000/users")
-    return resp.json()
+    resp = await client.get("/users")
+    _remote_cache["data"] = resp.json()
+    _remote_cache["ts"] = time.monotonic()
+    return _remote_cache["data"]
   except Exception as e:
-    raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.on_event("shutdown")
+async def close_client():
+  await client.aclose()
@@ -7,29 +7,51 @@
 # ==============================================================
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-import json, os
+import json, os, sqlite3
 
 # --------------------------------------------------------------
 # FastAPI cria uma interface HTTP para comunicação remota.
 # Aqui o app é como um "servidor RMI" — ele disponibiliza métodos
 # que podem ser chamados de forma remota por outro serviço.
 # --------------------------------------------------------------
+# default_response_class=ORJSONResponse: as respostas JSON são
+# serializadas pelo orjson (implementado em C), bem mais rápido que
+# o json da biblioteca padrão.
 app = FastAPI(
-  title="User service", 
-  description="Serviço de cadastro de usuário", 
-  version="1.0"
+  title="User service",
+  description="Serviço de cadastro de usuário",
+  version="1.0",
+  default_response_class=ORJSONResponse
 )
 
-DATA_FILE = "users.json"
+DB_FILE = "users.db"
+LEGACY_DATA_FILE = "users.json"
 
 # --------------------------------------------------------------
-# O arquivo JSON representa o "recurso compartilhado" entre
-# processos distribuídos. Em um sistema real, isso seria um BD.
+# O banco SQLite representa o "recurso compartilhado" entre
+# processos distribuídos. A chave primária em email transforma a
+# busca e a deduplicação em consultas indexadas (O(log N)), em vez
+# de reler e varrer um arquivo JSON inteiro a cada requisição.
 # --------------------------------------------------------------
-if not os.path.exists(DATA_FILE):
-  with open(DATA_FILE, 'w') as f:
-    json.dump([],f)
+db = sqlite3.connect(DB_FILE, check_same_thread=False)
+db.row_factory = sqlite3.Row
+db.execute("CREATE TABLE IF NOT EXISTS users (email TEXT PRIMARY KEY, name TEXT)")
+db.commit()
+
+# Importa os usuários do antigo arquivo JSON, se ele existir.
+if os.path.exists(LEGACY_DATA_FILE):
+  with open(LEGACY_DATA_FILE, 'r') as f:
+    try:
+      legacy_users = json.load(f)
+    except json.JSONDecodeError:
+      legacy_users = []
+  with db:
+    db.executemany(
+      "INSERT OR IGNORE INTO users (email, name) VALUES (?, ?)",
+      [(u["email"], u["name"]) for u in legacy_users]
+    )
 
 # --------------------------------------------------------------
 # Modelo de dados (equivalente a um tipo estruturado no RPC)
@@ -46,25 +68,14 @@ class User(BaseModel):
 @app.post("/register")
 def register_user(user: User):
   try:
-    # Load users safely
-    with open(DATA_FILE,'r+') as f:
-      try:
-        users = json.load(f)
-      except json.JSONDecodeError:
-        users = []
-
-      # # Check if user already exists
-      if any(u['email'] == user.email for u in users):
-        raise HTTPException(status_code=400, detail="User already exists")
-      
-      # Append new user correctly
-      users.append(user.model_dump())
-      f.seek(0)
-      json.dump(users, f, indent=2)
-      f.truncate()
-  except Exception as e:
+    with db:
+      db.execute("INSERT INTO users (email, name) VALUES (?, ?)", (user.email, user.name))
+  except sqlite3.IntegrityError:
+    # Chave primária duplicada: o usuário já está cadastrado.
+    raise HTTPException(status_code=400, detail="User already exists")
+  except sqlite3.Error as e:
     raise HTTPException(status_code=500, detail=f"Internal error: {e}")
-  
+
   return {"message": f"User {user.name} registered successfully!"}
 
 
@@ -75,11 +86,7 @@ def register_user(user: User):
 @app.get("/users")
 def list_users():
   try:
-    with open(DATA_FILE, "r") as f:
-      try:
-        users = json.load(f)
-      except json.JSONDecodeError:
-        raise HTTPException(status_code=404, detail=f"Users not founds.") 
-  except Exception as e:
+    rows = db.execute("SELECT name, email FROM users").fetchall()
+  except sqlite3.Error as e:
     raise HTTPException(status_code=500, detail=f"Internal error: {e}")
-  return users
\ No newline at end of file
+  return [dict(row) for row in rows]